@@ -84,6 +84,18 @@ class distributions_ParamMixture(Distribution):
                               validate_args=validate_args,
                               allow_nan_stats=allow_nan_stats,
                               sample_shape=sample_shape)
+      probs_shape = self._cat.probs.shape
+      if probs_shape.ndims is None or probs_shape[-1].value is None:
+        raise NotImplementedError("Number of components must be statically "
+                                  "determined.")
+      self._num_components = probs_shape[-1].value
+
+      # probs has shape batch_shape + [num_components]; transpose to
+      # broadcast with [num_components] + batch_shape in marginal_log_prob.
+      p_ndims = probs_shape.ndims
+      perm = [p_ndims - 1] + list(range(p_ndims - 1))
+      self._log_transposed_probs = tf.log(tf.transpose(self._cat.probs, perm))
+
       self._component_params = component_params
       self._components = component_dist(validate_args=validate_args,
                                         allow_nan_stats=allow_nan_stats,
@@ -101,41 +113,34 @@ class distributions_ParamMixture(Distribution):
           raise TypeError("Dimensions of mixing_weights are not compatible "
                           "with the dimensions of components.")
 
-      try:
-        self._num_components = self._cat.probs.shape.as_list()[-1]
-      except:  # if p has TensorShape None
-        raise NotImplementedError("Number of components must be statically "
-                                  "determined.")
+      # components has shape sample_shape + [num_components] + batch_shape
+      # + event_shape; cache the position of the num_components dimension.
+      self._batch_event_rank = (self._cat.batch_shape.ndims +
+                                self._components.event_shape.ndims)
+      self._cat_axis = (self._components.shape.ndims - 1 -
+                        self._batch_event_rank)
 
       self._mean_val = None
       self._variance_val = None
-      self._stddev_val = None
-      if self._cat.probs.shape.ndims <= 1:
+      if probs_shape.ndims <= 1:
         with tf.name_scope('means'):
           try:
             comp_means = self._components.mean()
             comp_vars = self._components.variance()
-            comp_mean_sq = tf.square(comp_means) + comp_vars
-
-            # weights has shape batch_shape + [num_components]; change
-            # to broadcast with [num_components] + batch_shape + event_shape.
-            # The below reshaping only works for empty batch_shape.
-            weights = self._cat.probs
-            event_rank = self._components.event_shape.ndims
-            for _ in range(event_rank):
-              weights = tf.expand_dims(weights, -1)
-
-            self._mean_val = tf.reduce_sum(comp_means * weights, 0,
-                                           name='mean')
-            mean_sq_val = tf.reduce_sum(comp_mean_sq * weights, 0,
-                                        name='mean_squared')
-            self._variance_val = tf.subtract(mean_sq_val,
-                                             tf.square(self._mean_val),
-                                             name='variance')
-            self._stddev_val = tf.sqrt(self._variance_val, name='stddev')
-          except:
-            # This fails if _components.{mean,variance}() fails.
+          except (NotImplementedError, AttributeError, ValueError):
+            # Components without a (defined) mean or variance leave the
+            # mixture's mean and variance unavailable.
             pass
+          else:
+            # weight the components by contracting over the leading
+            # num_components dimension. This only works for empty
+            # batch_shape, where weights has shape [num_components].
+            weights = self._cat.probs
+            self._mean_val = tf.tensordot(weights, comp_means, 1, name='mean')
+            # law of total variance: E[Var(X | cat)] + Var(E[X | cat])
+            self._variance_val = tf.tensordot(
+                weights, tf.square(comp_means - self._mean_val) + comp_vars, 1,
+                name='variance')
 
     super(distributions_ParamMixture, self).__init__(
         dtype=self._components.dtype,
@@ -176,68 +181,63 @@ class distributions_ParamMixture(Distribution):
 #     'observed variable given the categorical variable `cat`. For the '
 #     'marginal log probability, use `marginal_log_prob()`.')
   def _log_prob(self, x, conjugate=False, **kwargs):
-    batch_event_rank = self.event_shape.ndims + self.batch_shape.ndims
-    # expand x to broadcast log probs over num_components dimension
-    expanded_x = tf.expand_dims(x, -1 - batch_event_rank)
-    if conjugate:
-      log_probs = self.components.conjugate_log_prob(expanded_x)
-    else:
-      log_probs = self.components.log_prob(expanded_x)
+    log_probs = self._component_log_prob(x, conjugate)
 
-    cat_axis = self.components.shape.ndims - 1 - batch_event_rank
-    selecter = tf.one_hot(self.cat, self.num_components,
-                          axis=cat_axis, dtype=log_probs.dtype)
-
-    # selecter has shape [n] + [num_components] + batch_shape; change
-    # to broadcast with [n] + [num_components] + batch_shape + event_shape.
-    while selecter.shape.ndims < log_probs.shape.ndims:
-      selecter = tf.expand_dims(selecter, -1)
-
-    # select the sampled component, sum out the component dimension
-    return tf.reduce_sum(log_probs * selecter, -1 - batch_event_rank)
+    if conjugate:
+      # ed.complete_conditional recognizes the categorical conditional of
+      # `cat` by its one-hot sufficient statistic, so keep the one-hot
+      # selection on the conjugate path. The one-hot must be built in the
+      # dtype of log_probs: a Cast, or a bool mask consumed by tf.where,
+      # is not linear to the conjugacy matcher and hides the statistic.
+      selecter = tf.one_hot(self.cat, self.num_components,
+                            axis=self._cat_axis, dtype=log_probs.dtype)
+
+      # selecter has shape [n] + [num_components] + batch_shape; change
+      # to broadcast with [n] + [num_components] + batch_shape + event_shape.
+      # A reshape would need tf.shape(self.cat), which the conjugacy
+      # matcher would treat as another statistic of `cat`.
+      while selecter.shape.ndims < log_probs.shape.ndims:
+        selecter = tf.expand_dims(selecter, -1)
+
+      # select the sampled component, sum out the component dimension
+      return tf.reduce_sum(log_probs * selecter, self._cat_axis)
+
+    # select the log prob of the sampled component
+    return _select_component(log_probs, self.cat, self._cat_axis)
 
   def conjugate_log_prob(self):
     return self._log_prob(self, conjugate=True)
 
-  def marginal_log_prob(self, x, **kwargs):
-    'The marginal log probability of the observed variable. Sums out `cat`.'
-    batch_event_rank = self.event_shape.ndims + self.batch_shape.ndims
+  def _component_log_prob(self, x, conjugate=False):
+    'Log probability of `x` under each component, without selecting `cat`.'
     # expand x to broadcast log probs over num_components dimension
-    expanded_x = tf.expand_dims(x, -1 - batch_event_rank)
-    log_probs = self.components.log_prob(expanded_x)
+    expanded_x = tf.expand_dims(x, -1 - self._batch_event_rank)
+    if conjugate:
+      return self.components.conjugate_log_prob(expanded_x)
+    else:
+      return self.components.log_prob(expanded_x)
 
-    p_ndims = self.cat.probs.shape.ndims
-    perm = tf.concat([[p_ndims - 1], tf.range(p_ndims - 1)], 0)
-    transposed_p = tf.transpose(self.cat.probs, perm)
+  def marginal_log_prob(self, x, **kwargs):
+    'The marginal log probability of the observed variable. Sums out `cat`.'
+    log_probs = self._component_log_prob(x)
 
-    return tf.reduce_logsumexp(log_probs + tf.log(transposed_p),
-                               -1 - batch_event_rank)
+    return tf.reduce_logsumexp(log_probs + self._log_transposed_probs,
+                               -1 - self._batch_event_rank)
 
   def _sample_n(self, n, seed=None):
     if getattr(self, '_value', None) is not None:
+      # TODO avoid sampling n per component
       cat_sample = self.cat.sample(n)
       comp_sample = self.components.sample(n)
-    else:
-      cat_sample = self.cat
-      comp_sample = self.components
+      # comp_sample has shape [n] + [num_components] + batch_shape +
+      # event_shape; select the sampled component
+      return _select_component(comp_sample, cat_sample, 1)
+
+    result = _select_component(self.components, self.cat, self._cat_axis)
+    if n == 1:
       # Add a leading dimension like Distribution.sample(1) would.
-      if n == 1:
-        comp_sample = tf.expand_dims(comp_sample, 0)
-        cat_sample = tf.expand_dims(cat_sample, 0)
-
-    # TODO avoid sampling n per component
-    batch_event_rank = self.event_shape.ndims + self.batch_shape.ndims
-    cat_axis = comp_sample.shape.ndims - 1 - batch_event_rank
-    selecter = tf.one_hot(cat_sample, self.num_components,
-                          axis=cat_axis, dtype=self.dtype)
-
-    # selecter has shape [n] + [num_components] + batch_shape; change
-    # to broadcast with [n] + [num_components] + batch_shape + event_shape.
-    while selecter.shape.ndims < comp_sample.shape.ndims:
-      selecter = tf.expand_dims(selecter, -1)
-
-    # select the sampled component, sum out the component dimension
-    result = tf.reduce_sum(comp_sample * selecter, cat_axis)
+      result = tf.expand_dims(result, 0)
+
     return result
 
   def _mean(self):
@@ -247,10 +247,10 @@ class distributions_ParamMixture(Distribution):
     return self._mean_val
 
   def _stddev(self):
-    if self._stddev_val is None:
+    if self._variance_val is None:
       raise NotImplementedError()
 
-    return self._stddev_val
+    return tf.sqrt(self._variance_val, name='stddev')
 
   def _variance(self):
     if self._variance_val is None:
@@ -259,6 +259,61 @@ class distributions_ParamMixture(Distribution):
     return self._variance_val
 
 
+def _select_component(params, indices, axis):
+  """Select one entry of `params` along `axis` per position in `indices`.
+
+  This is equivalent to multiplying `params` by `tf.one_hot(indices,
+  depth, axis=axis)` and summing out `axis`, but it gathers only the
+  selected entries instead of materializing a mask as large as `params`.
+
+  Args:
+    params: tf.Tensor.
+      Tensor of shape `outer_shape + [depth] + inner_shape`.
+    indices: tf.Tensor.
+      Integer tensor broadcastable to `outer_shape + inner_shape`. Its
+      shape must include all of `outer_shape`; missing trailing
+      dimensions of `inner_shape` are broadcast.
+    axis: int.
+      Static, non-negative position of the `depth` dimension.
+
+  Returns:
+    tf.Tensor of shape `outer_shape + inner_shape`.
+
+  Raises:
+    ValueError: If `indices` has fewer dimensions than `axis`.
+  """
+  params = tf.convert_to_tensor(params)
+  indices = tf.convert_to_tensor(indices)
+  if indices.shape.ndims < axis:
+    raise ValueError("indices must have rank at least {0}; got rank "
+                     "{1}.".format(axis, indices.shape.ndims))
+
+  # indices has shape outer_shape + batch_shape; change to broadcast
+  # with outer_shape + batch_shape + event_shape.
+  num_trailing = params.shape.ndims - 1 - indices.shape.ndims
+  if num_trailing > 0:
+    indices = tf.reshape(indices, tf.concat(
+        [tf.shape(indices), tf.ones([num_trailing], tf.int32)], 0))
+
+  shape = tf.shape(params)
+  depth = shape[axis]
+  outer = tf.reduce_prod(shape[:axis])
+  inner = tf.reduce_prod(shape[axis + 1:])
+  result_shape = tf.concat([shape[:axis], shape[axis + 1:]], 0)
+
+  # broadcast indices to the result shape and compute flat positions of
+  # the selected entries in row-major order
+  indices = tf.cast(indices, tf.int32) + tf.zeros(result_shape, tf.int32)
+  indices = tf.reshape(indices, [outer, inner])
+  flat_indices = (tf.expand_dims(tf.range(outer) * depth, 1) + indices) * \
+      inner + tf.range(inner)
+
+  result = tf.gather(tf.reshape(params, [-1]), flat_indices)
+  result = tf.reshape(result, result_shape)
+  result.set_shape(params.shape[:axis].concatenate(params.shape[axis + 1:]))
+  return result
+
+
 # Generate random variable class similar to autogenerated ones from TensorFlow.
 def __init__(self, *args, **kwargs):
   RandomVariable.__init__(self, *args, **kwargs)
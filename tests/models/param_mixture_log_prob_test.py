@@ -0,0 +1,124 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import edward as ed
+import numpy as np
+import tensorflow as tf
+
+from edward.models import Dirichlet, Normal, ParamMixture
+from edward.models.param_mixture import _select_component
+
+
+def _one_hot_select(params, indices, axis):
+  selecter = tf.one_hot(indices, params.shape[axis].value, axis=axis,
+                        dtype=params.dtype)
+  while selecter.shape.ndims < params.shape.ndims:
+    selecter = tf.expand_dims(selecter, -1)
+
+  return tf.reduce_sum(params * selecter, axis)
+
+
+class test_param_mixture_log_prob_class(tf.test.TestCase):
+
+  def _test_select(self, params_shape, indices_shape, axis):
+    params = tf.constant(np.random.randn(*params_shape), tf.float32)
+    depth = params_shape[axis]
+    indices = tf.constant(np.random.randint(depth, size=indices_shape),
+                          tf.int32)
+    val_est = _select_component(params, indices, axis)
+    val_true = _one_hot_select(params, indices, axis)
+    self.assertEqual(val_est.shape, val_true.shape)
+    self.assertAllClose(val_est.eval(), val_true.eval())
+
+  def test_select_sample_shape(self):
+    with self.test_session():
+      self._test_select([5, 3], [5], 1)
+      self._test_select([4, 5, 3], [4, 5], 2)
+
+  def test_select_batch_shape(self):
+    with self.test_session():
+      self._test_select([3, 2], [2], 0)
+      self._test_select([5, 3, 2, 4], [5, 2, 4], 1)
+
+  def test_select_event_shape(self):
+    with self.test_session():
+      self._test_select([5, 3, 4], [5], 1)
+      self._test_select([5, 3, 2, 4], [5, 2], 1)
+
+  def test_select_broadcast_indices(self):
+    with self.test_session():
+      self._test_select([5, 3, 2], [1, 2], 1)
+      self._test_select([5, 3, 2, 4], [1, 2], 1)
+
+  def test_select_rank_too_small(self):
+    with self.test_session():
+      params = tf.zeros([5, 4, 3])
+      indices = tf.zeros([5], tf.int32)
+      self.assertRaises(ValueError, _select_component, params, indices, 2)
+
+  def test_log_prob_event_1d(self):
+    """Log prob of a mixture of 2 Dirichlet distributions."""
+    with self.test_session() as sess:
+      probs = np.array([0.4, 0.6], np.float32)
+      concentration = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]],
+                               np.float32)
+      x = ParamMixture(probs, {'concentration': concentration}, Dirichlet,
+                       sample_shape=5)
+      val_est = x.log_prob(x)
+      val_true = Dirichlet(tf.gather(concentration, x.cat)).log_prob(x)
+      self.assertEqual(val_est.shape, (5,))
+      val_est, val_true = sess.run([val_est, val_true])
+      self.assertAllClose(val_est, val_true)
+
+  def test_conjugate_log_prob_event_1d(self):
+    """Conjugate log prob of a mixture of 2 Dirichlet distributions."""
+    with self.test_session() as sess:
+      probs = np.array([0.4, 0.6], np.float32)
+      concentration = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]],
+                               np.float32)
+      x = ParamMixture(probs, {'concentration': concentration}, Dirichlet,
+                       sample_shape=5)
+      val_est = x.conjugate_log_prob()
+      val_true = Dirichlet(tf.gather(concentration, x.cat)).log_prob(x)
+      self.assertEqual(val_est.shape, (5,))
+      val_est, val_true = sess.run([val_est, val_true])
+      self.assertAllClose(val_est, val_true)
+
+  def _test_marginal(self, sess, probs, loc, x_val):
+    x = ParamMixture(probs, {'loc': loc, 'scale': tf.ones_like(loc)},
+                     Normal)
+    x_val = tf.constant(x_val)
+    val_est = x.marginal_log_prob(x_val)
+    log_probs = x.components.log_prob(tf.expand_dims(x_val, -1))
+    val_true = tf.reduce_logsumexp(log_probs + tf.log(probs), -1)
+    grad_est = tf.gradients(val_est, x_val)[0]
+    val_est, val_true, grad_est = sess.run([val_est, val_true, grad_est])
+    self.assertAllClose(val_est, val_true)
+    return grad_est
+
+  def test_marginal_log_prob(self):
+    with self.test_session() as sess:
+      probs = np.array([0.2, 0.3, 0.5], np.float32)
+      loc = np.array([1.0, 5.0, 7.0], np.float32)
+      x_val = np.array([0.0, 1.0, 4.5, 6.0, 10.0], np.float32)
+      self._test_marginal(sess, probs, loc, x_val)
+
+  def test_marginal_log_prob_zero_weight(self):
+    """A zero-weight component must not set the shift of the logsumexp."""
+    with self.test_session() as sess:
+      probs = np.array([0.0, 1.0], np.float32)
+      loc = np.array([0.0, 20.0], np.float32)
+      x_val = np.array([0.0, 20.0], np.float32)
+      grad = self._test_marginal(sess, probs, loc, x_val)
+      self.assertTrue(np.all(np.isfinite(grad)))
+
+  def test_marginal_log_prob_all_inf(self):
+    with self.test_session() as sess:
+      probs = np.array([0.4, 0.6], np.float32)
+      loc = np.array([0.0, 1.0], np.float32)
+      x_val = np.array([1e20, -1e20], np.float32)
+      self._test_marginal(sess, probs, loc, x_val)
+
+if __name__ == '__main__':
+  tf.test.main()